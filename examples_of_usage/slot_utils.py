@@ -0,0 +1,337 @@
+"""
+Shared helpers for the example scripts:
+- two_digits_image
+- select_on_display
+- get_slots_paths
+
+Keeping them in one module means the hub compiles the code once and
+every example reuses the same bytecode instead of carrying its own
+copy of the functions.
+"""
+import hub
+import os
+import utime
+
+# Cache of already generated images. select_on_display regenerates
+# the image on every button poll, so each number is built only once
+# and further calls are a single dict lookup.
+_image_cache = {}
+
+# Display configurations as (delay, fade) pairs: images and single
+# characters are shown statically, longer text scrolls.
+_CFG_STATIC = (0, 0)
+_CFG_SCROLL = (500, 4)
+
+# Cache of already resolved slot paths, keyed by the get_slots_paths
+# arguments. The examples call the function several times per run
+# and the slots do not change in between.
+_paths_cache = {}
+
+# Raw contents of projects/.slots, read at most once per run so the
+# repeated parses are pure in-memory operations.
+_slots_raw = None
+
+# Largest range for which select_on_display precomputes the whole
+# display table before the selection loop. Bigger ranges (the examples
+# use range(100) and a 67-character string) are filled in lazily, so
+# entries the user never scrolls to are never built.
+_EAGER_TABLE_LIMIT = 30
+
+
+def refresh():
+    """
+    Drop the cached slot data.
+
+    Call it after new files were uploaded to the hub, so the next
+    get_slots_paths call re-reads projects/.slots from disk.
+    """
+    global _slots_raw
+    _slots_raw = None
+    _paths_cache.clear()
+
+
+def two_digits_image(number: int):
+    """
+    Generate a 5x5 image representation of a two-digit number
+    using predefined patterns.
+
+    Args:
+    - number (int): A two-digit number (10-99, both inclusive)
+                    for which the image is generated.
+
+    Returns: An image representation based on the input number.
+    Raises:
+    - ValueError: If the input number is not within the range 10-99
+                  (both inclusive).
+    """
+    if not (10 <= number <= 99):
+        raise ValueError('number is not in the range 10-99 (both inclusive).')
+
+    if number not in _image_cache:
+        digits_2 = ['9999999999', '9090909090', '9909999099', '9909990999',
+                    '9999990909', '9990990999', '9990999999', '9909090909',
+                    '9999009999', '9999990999']
+
+        digits_3 = ['999909909909999', '090090090090090', '999009999900999',
+                    '999009999009999', '909909999009009', '999900999009999',
+                    '999900999909999', '999009009009009', '999909999909999',
+                    '999909999009999']
+
+        tens, ones = divmod(number, 10)
+
+        # Collect the fragments and join them once: repeated
+        # image = image + ... reallocates the whole string on
+        # every iteration.
+        parts = []
+
+        for i in range(5):
+            start = 2 * i
+            end = start + 2
+            if tens == 1:
+                start_3 = 3 * i
+                second_digit = digits_3[ones][start_3:start_3 + 3]
+            else:
+                second_digit = '0' + digits_2[ones][start:end]
+            parts.append(digits_2[tens][start:end])
+            parts.append(second_digit)
+            parts.append(':')
+
+        _image_cache[number] = hub.Image(''.join(parts))
+
+    return _image_cache[number]
+
+
+def select_on_display(range_, two_digits_font=True):
+    """
+    Allows users to interactively select and display a value
+    from a given range on a display.
+
+    Parameters:
+    - range_ (iterable, optional): A sequence of values to select from.
+    - two_digits_font (bool, optional): Determines whether to display
+                                        two-digit values
+                                        in a special font.
+                                        (default: True)
+
+    Returns:
+    - selected_value: The value selected from the provided range.
+
+    Note:
+    - This function assumes that the hub library has been imported.
+    - This function assumes the existence of external functions:
+        - two_digits_image(int): Generate a 5x5 image representation
+        of a two-digit number using predefined patterns.
+    - This function returns a value of the same type as the type
+      of the selected element from the given _range.
+    """
+    if not isinstance(range_, (str, range, tuple, list)):
+        raise TypeError('the given argument must be of type '
+                        'str, range, tuple or list')
+
+    # For range objects the value at an index is plain arithmetic,
+    # which is cheaper than the __getitem__ bounds check plus int
+    # construction.
+    is_range = isinstance(range_, range)
+
+    def _get_value_from_callback(value):
+        nonlocal gesture
+        gesture = value
+
+    def _get_data_to_show(i: int):
+        """
+        Retrieves the formatted data to display on the output device
+        based on the selected index.
+
+        Parameters:
+        - i (int): The index of the value in the provided range
+                to generate display data for.
+
+        Returns:
+        - _data_to_show (str): The formatted data to be displayed.
+        - _delay (int): The delay time for displaying the data
+                        (in milliseconds).
+        - _fade (int): The fade effect type for displaying the data.
+        """
+        nonlocal range_
+        nonlocal two_digits_font
+
+        value = range_.start + range_.step * i if is_range else range_[i]
+        # Coerce to text once and reuse it for both the digit test
+        # and the fallback display string.
+        text = str(value)
+
+        if isinstance(value, (int, str)) and text.isdigit():
+            value = int(text)
+            if 10 <= value <= 99 and two_digits_font:
+                return (two_digits_image(value),) + _CFG_STATIC
+
+        if len(text) > 1:
+            return (text + ' ',) + _CFG_SCROLL
+
+        return (text,) + _CFG_STATIC
+
+    gesture = -1
+    selected = 0
+    hub.led(255, 0, 255)
+    range_len = len(range_)
+
+    if range_len != 1:
+        print('Select value on the Hub.\n'
+              'Use left and right buttons to select value, '
+              'tap the hub to confirm your choice.')
+
+        # Prepare the display data once per value, so the loop below
+        # only indexes a table instead of rebuilding images on each
+        # button poll. Small ranges are precomputed up front; large
+        # ones are memoized on first visit to keep startup quick.
+        if range_len <= _EAGER_TABLE_LIMIT:
+            display_table = [_get_data_to_show(i) for i in range(range_len)]
+        else:
+            display_table = [None] * range_len
+
+        # Bind the hub methods to locals: dotted attribute lookups
+        # are slow on MicroPython and these run on every tick.
+        left_presses = hub.button.left.presses
+        right_presses = hub.button.right.presses
+        show = hub.display.show
+
+        left_presses()
+        right_presses()
+
+        hub.motion.gesture(callback=_get_value_from_callback)
+
+        last_rendered = None
+
+        while gesture != 0:
+            presses = right_presses() - left_presses()
+            new_selected = selected + presses
+            # presses is almost always -1, 0 or 1, so the in-range
+            # check keeps the common case to two compares and takes
+            # the modulo path only on wrap-around.
+            if 0 <= new_selected < range_len:
+                selected = new_selected
+            else:
+                selected = new_selected % range_len
+
+            if selected != last_rendered:
+                entry = display_table[selected]
+                if entry is None:
+                    entry = display_table[selected] = \
+                        _get_data_to_show(selected)
+                data_to_show, delay, fade = entry
+
+                show(data_to_show, delay=delay, wait=True, fade=fade)
+                last_rendered = selected
+            else:
+                # Nothing changed - yield instead of hammering
+                # the display driver in a tight poll loop.
+                utime.sleep_ms(20)
+        hub.motion.gesture(callback=None)
+
+    if is_range:
+        chosen = range_.start + range_.step * selected
+    else:
+        chosen = range_[selected]
+
+    print(' \n"{}" was selected.'.format(chosen))
+
+    hub.display.clear()
+    hub.led(10)
+
+    return chosen
+
+
+def _load_slots_dict() -> dict:
+    """
+    Read the projects/.slots file once and return the slots dictionary.
+
+    Every caller that needs slot metadata should go through this helper
+    instead of re-opening and re-parsing the file on its own.
+
+    The file stores a Python dict literal with single quotes and
+    integer keys, which is not valid JSON, so eval is the one parser
+    that handles the real format.
+
+    The raw line is kept in memory after the first read; call
+    refresh() to force a re-read from disk.
+    """
+    global _slots_raw
+    if _slots_raw is None:
+        with open('projects/.slots', 'r') as slots_file:
+            _slots_raw = slots_file.readline()
+    return eval(_slots_raw)
+
+
+def get_slots_paths(extension: str = '.py',
+                    do_check: bool = False,
+                    check_word: str = '') -> dict:
+    """
+    This function retrieves the paths associated with available slots
+    from the projects/.slots file.
+
+    Args:
+    - extension (str, optional): The file extension to append the path
+                                 (default: '.py').
+    - do_check (bool, optional): Flag to indicate whether to perform
+                                 a file format check (default: False).
+    - check_word (str, optional): The word used for file format checking
+                                  (default: empty string).
+
+    Returns:
+    - dict: The dictionary of available slots and their paths,
+            or empty dictionary, if no available slots.
+
+    File format check:
+    If the do_check argument is True, the function compares
+    the first word of the file with check_word.
+    If they match, the test is passed.
+    If they are different, that slot-path pair is excluded
+    from the dictionary.
+
+    Note: the function was tested with Mindstorms app
+    and SPIKE Legacy app on Mindstorms hub.
+    If you can test it with SPIKE 3 app on the Spike Prime hub,
+    please, give me feedback (GizmoBricksChannel@gmail.com)
+    """
+    cache_key = (extension, do_check, check_word)
+    cached = _paths_cache.get(cache_key)
+    if cached is not None:
+        return cached
+
+    # Collect valid slots into a fresh dict: deleting keys from the
+    # dict while iterating over it is not allowed.
+    available = {}
+
+    for key, slot_data in _load_slots_dict().items():
+        # An explicit None sentinel instead of truthiness: an empty
+        # id would otherwise be skipped silently, and a missing one
+        # would raise KeyError.
+        project_id = slot_data.get('id')
+        if project_id is None:
+            continue
+
+        path = 'projects/{}/__init__{}'.format(project_id, extension)
+
+        try:
+            if do_check:
+                with open(path, 'r') as test_file:
+                    # startswith plus a separator guard checks the
+                    # first word in place, without tokenizing the
+                    # whole line the way split() does.
+                    line = test_file.readline()
+                    passed = (line.startswith(check_word)
+                              and (len(line) == len(check_word)
+                                   or line[len(check_word)] in ' \t\r\n'))
+                    if not passed:
+                        continue
+            else:
+                # stat is much cheaper than opening the file and
+                # still raises OSError when the slot is missing.
+                os.stat(path)
+        except OSError:
+            continue
+
+        available[key] = path
+
+    _paths_cache[cache_key] = available
+    return available
@@ -52,6 +52,8 @@ GizmoBricks
 from mindstorms.control import wait_for_seconds, Timer
 from math import pi
 import hub
+import json
+import os
 
 # Constants:
 
@@ -130,6 +132,12 @@ X_END_COLOR = 'yellow'
 class Axis:
     VALID_DIRECTIONS = (-1, 1)
 
+    # Color-name to sensor-value mapping, kept on the class so
+    # _run_until_color does not rebuild the dict on every call.
+    _COLOR_VALUES = {'black': 0, 'violet': 1, 'blue': 3, 'cyan': 4,
+                     'green': 5, 'yellow': 7, 'red': 9, 'white': 10,
+                     None: -1}
+
     def __init__(self, motor,
                  gear_ratio: float, wheel_diameter: float,
                  dot_dimension: float = 1,
@@ -174,9 +182,19 @@ class Axis:
 
         self.correction_step = self._calculate_step(self.correction_value)
         self.step = self._calculate_step(self.dot_dimension)
+        # Per-dot displacement, cached so move_steps does a single
+        # multiply on the critical path.
+        self._step_dir = self.step * self.direction
 
         self.end = self._read_end_from_file()
         self.length = self._calculate_length()
+        self._update_limits()
+
+        # Shadow of the motor position. Every position query over the
+        # port is a slow device transaction, so the axis tracks the
+        # last commanded target instead and re-reads the real encoder
+        # only in sync_position (after calibration or preset).
+        self._position = 0
 
     @staticmethod
     def _read_end_from_file():
@@ -209,6 +227,19 @@ class Axis:
             return None
         return int(self.end / self.step)
 
+    def _update_limits(self):
+        """
+        Cache the axis limits. self.end changes exactly once - at
+        calibration - so _check_target should not recompute min/max
+        on every dot.
+        """
+        if self.end is None:
+            self._min_target = None
+            self._max_target = None
+        else:
+            self._min_target = min(self.end, 0)
+            self._max_target = max(self.end, 0)
+
     def _check_target(self, target_position):
         """
         Check if the target position is within the axis limits.
@@ -220,13 +251,12 @@ class Axis:
                           is outside the limits of the axis.
         """
         if self.end is not None:
-            min_ = min(self.end, 0)
-            max_ = max(self.end, 0)
-
-            if not (min_ <= target_position <= max_):
+            if not (self._min_target <= target_position
+                    <= self._max_target):
                 raise RuntimeError(
                     'Target position {0} is outside the axis limits[{1}, {2}].'
-                    ''.format(target_position, min_, max_))
+                    ''.format(target_position,
+                              self._min_target, self._max_target))
 
     def _run_until_color(self, color, direction: int):
         """
@@ -236,18 +266,17 @@ class Axis:
             color: The color to be detected.
             direction: The direction of motor movement.
         """
-        color_values = {'black': 0, 'violet': 1, 'blue': 3, 'cyan': 4,
-                        'green': 5, 'yellow': 7, 'red': 9, 'white': 10,
-                        None: -1}
         if isinstance(color, str):
-            color_value = color_values.get(color)
+            color_value = self._COLOR_VALUES.get(color)
         else:
             color_value = color
 
         if self.sensor.get()[1] != color_value:
             self.motor.run_at_speed(self.speed * direction)
             while self.sensor.get()[1] != color_value:
-                continue
+                # Yield to the firmware scheduler instead of spinning
+                # the interpreter at full speed.
+                wait_for_seconds(0.001)
             self.motor.brake()
 
     def wait_until_motion_done(self):
@@ -255,7 +284,17 @@ class Axis:
         Wait until the motor finishes its motion.
         """
         while self.motor.busy(1):
-            continue
+            wait_for_seconds(0.001)
+
+    def sync_position(self):
+        """
+        Read the real motor position and store it in the shadow.
+
+        Call it whenever the motor could have moved outside
+        run_to_position - after calibration, preset or a stall.
+        """
+        self._position = self.motor.get()[1]
+        return self._position
 
     def set_steps(self, dot_dim: float, correction: float,
                   gear_ratio: float, wheel_dim: float) -> None:
@@ -279,6 +318,7 @@ class Axis:
 
         self.correction_step = self._calculate_step(self.correction_value)
         self.step = self._calculate_step(self.dot_dimension)
+        self._step_dir = self.step * self.direction
 
     def calibrate(self, first_color='0', second_color='0', *,
                   set_as_zero: bool = True, direction: int = -1):
@@ -322,7 +362,7 @@ class Axis:
 
         wait_for_seconds(0.1)
 
-        return self.motor.get()[1]
+        return self.sync_position()
 
     def calibrate_zero(self):
         zero_colors = self.zero_colors
@@ -343,14 +383,16 @@ class Axis:
                 file.write(__name__ + '\n')
                 file.write(str(self.end))
 
+        self._update_limits()
         self.length = int(self.end / self.step)
         return self.end
 
     def go_home(self):
         self.motor.run_to_position(0, self.speed)
+        self._position = 0
 
     def run_to_position(self, position, wait: bool = False,
-                        mode: str = 'degrees'):
+                        mode: str = 'degrees', correction: bool = True):
         """
         Run the motor to a specific position.
 
@@ -358,6 +400,10 @@ class Axis:
             position: The target position to move to.
             wait: Whether to wait for the motion to complete or not.
             mode:
+            correction: Whether backlash correction may be applied.
+                        Must be False while the pen is down: the
+                        correction pass overshoots the target, which
+                        would ink pixels past the current run.
         """
         valid_modes = ('degrees', 'steps')
 
@@ -371,23 +417,28 @@ class Axis:
             target = self.step * position
 
         self._check_target(target)
-        current_position = self.motor.get()[1]
-        if target < current_position and self.backlash_correction:
+        # Every corrected stop is approached from below, so a leftward
+        # move always has to take up the gear lash again - correct it
+        # unconditionally, as the baseline did.
+        if (correction and self.backlash_correction
+                and target < self._position):
             self.motor.run_to_position(target - self.correction_step,
                                        self.speed)
             self.wait_until_motion_done()
         self.motor.run_to_position(target, self.speed)
+        self._position = target
         if wait:
             self.wait_until_motion_done()
 
     def move_steps(self, steps, wait: bool = False):
-        target = self.motor.get()[1] + self.step * self.direction * steps
+        target = self._position + self._step_dir * steps
         self._check_target(target)
         if wait:
             self.motor.run_to_position(target, self.speed)
+            self._position = target
 
     def get_position(self):
-        return self.motor.get()[1]
+        return self._position
 
 
 class Pen:
@@ -480,7 +531,42 @@ def run_to_absolute_position(motor,
     motor.run_to_position(target, speed)
 
     while motor.busy(1):
-        continue
+        wait_for_seconds(0.001)
+
+
+# Images already generated by two_digits_image. The function runs on
+# every refresh of the slot-selection screen, so each number is built
+# at most once per run.
+_two_digit_images = {}
+
+# Digit glyphs as tuples of display rows: two columns per digit, and
+# three columns for the second digit when the first one is 1. Row
+# tuples let the builder join whole rows at once instead of slicing
+# flat pattern strings.
+_DIGIT_ROWS_2 = (
+    ('99', '99', '99', '99', '99'),
+    ('90', '90', '90', '90', '90'),
+    ('99', '09', '99', '90', '99'),
+    ('99', '09', '99', '09', '99'),
+    ('99', '99', '99', '09', '09'),
+    ('99', '90', '99', '09', '99'),
+    ('99', '90', '99', '99', '99'),
+    ('99', '09', '09', '09', '09'),
+    ('99', '99', '00', '99', '99'),
+    ('99', '99', '99', '09', '99'),
+)
+_DIGIT_ROWS_3 = (
+    ('999', '909', '909', '909', '999'),
+    ('090', '090', '090', '090', '090'),
+    ('999', '009', '999', '900', '999'),
+    ('999', '009', '999', '009', '999'),
+    ('909', '909', '999', '009', '009'),
+    ('999', '900', '999', '009', '999'),
+    ('999', '900', '999', '909', '999'),
+    ('999', '009', '009', '009', '009'),
+    ('999', '909', '999', '909', '999'),
+    ('999', '909', '999', '009', '999'),
+)
 
 
 def two_digits_image(number: int):
@@ -500,30 +586,20 @@ def two_digits_image(number: int):
     if not (10 <= number <= 99):
         raise ValueError('number is not in the range 10-99 (both inclusive).')
 
-    digits_2 = ['9999999999', '9090909090', '9909999099', '9909990999',
-                '9999990909', '9990990999', '9990999999', '9909090909',
-                '9999009999', '9999990999']
-
-    digits_3 = ['999909909909999', '090090090090090', '999009999900999',
-                '999009999009999', '909909999009009', '999900999009999',
-                '999900999909999', '999009009009009', '999909999909999',
-                '999909999009999']
-
-    tens, ones = divmod(number, 10)
+    if number not in _two_digit_images:
+        tens, ones = divmod(number, 10)
 
-    image = ''
-
-    for i in range(5):
-        start = 2 * i
-        end = start + 2
+        first = _DIGIT_ROWS_2[tens]
         if tens == 1:
-            start_3 = 3 * i
-            second_digit = digits_3[ones][start_3:start_3 + 3]
+            second = _DIGIT_ROWS_3[ones]
+            rows = [first[i] + second[i] for i in range(5)]
         else:
-            second_digit = '0' + digits_2[ones][start:end]
-        image = image + digits_2[tens][start:end] + second_digit + ':'
+            second = _DIGIT_ROWS_2[ones]
+            rows = [first[i] + '0' + second[i] for i in range(5)]
+
+        _two_digit_images[number] = hub.Image(':'.join(rows) + ':')
 
-    return hub.Image(image)
+    return _two_digit_images[number]
 
 
 def select_on_display(range_, two_digits_font=True):
@@ -548,9 +624,16 @@ def select_on_display(range_, two_digits_font=True):
     - This function returns a value of the same type as the type
       of the selected element from the given _range.
     """
-    if not isinstance(range_, (str, range, tuple, list)):
-        raise TypeError('the given argument must be of type '
-                        'str, range, tuple or list')
+    # Duck typing instead of an isinstance chain: anything that has
+    # a length and supports indexing works, and the failed attempt is
+    # cheaper than four sequential type checks on MicroPython.
+    try:
+        range_len = len(range_)
+        if range_len:
+            range_[0]
+    except TypeError:
+        raise TypeError('the given argument must be a sequence, '
+                        'e.g. str, range, tuple or list')
 
     def _get_value_from_callback(value):
         nonlocal gesture
@@ -596,7 +679,6 @@ def select_on_display(range_, two_digits_font=True):
     gesture = -1
     selected = 0
     hub.led(255, 0, 255)
-    range_len = len(range_)
 
     if range_len != 1:
         print('Select value on the Hub.\n'
@@ -608,14 +690,23 @@ def select_on_display(range_, two_digits_font=True):
 
         hub.motion.gesture(callback=_get_value_from_callback)
 
+        last_shown = None
+
         while gesture != 0:
             presses = hub.button.right.presses() - hub.button.left.presses()
             new_selected = selected + presses
             selected = new_selected % range_len
 
-            data_to_show, delay, fade = _get_data_to_show(selected)
+            if selected != last_shown:
+                data_to_show, delay, fade = _get_data_to_show(selected)
 
-            hub.display.show(data_to_show, delay=delay, wait=True, fade=fade)
+                hub.display.show(data_to_show,
+                                 delay=delay, wait=True, fade=fade)
+                last_shown = selected
+            else:
+                # No change - let the scheduler breathe instead of
+                # redrawing the same screen at full poll rate.
+                wait_for_seconds(0.02)
         hub.motion.gesture(callback=None)
 
     print(' \n"{}" was selected.'.format(range_[selected]))
@@ -626,6 +717,39 @@ def select_on_display(range_, two_digits_font=True):
     return range_[selected]
 
 
+def _load_slots_dict() -> dict:
+    """
+    Return the slots dictionary from the projects/.slots file.
+
+    The parsed result is kept in slots_cache.txt (next to
+    settings.txt) together with the modification time of .slots, so
+    repeat runs skip the eval of the slots file as long as nothing
+    new was uploaded to the hub.
+    """
+    mtime = str(os.stat('projects/.slots')[8])
+
+    try:
+        with open('slots_cache.txt', 'r') as cache_file:
+            if cache_file.readline().rstrip() == mtime:
+                return {int(key): value for key, value
+                        in json.loads(cache_file.readline()).items()}
+    except (OSError, ValueError):
+        pass
+
+    with open('projects/.slots', 'r') as slots_file:
+        slots_dict = eval(slots_file.readline())
+
+    try:
+        with open('slots_cache.txt', 'w') as cache_file:
+            cache_file.write(mtime + '\n')
+            cache_file.write(json.dumps(slots_dict))
+    except OSError:
+        # A full or read-only filesystem only costs us the cache.
+        pass
+
+    return slots_dict
+
+
 def get_slots_paths(extension: str = '.py',
                     do_check: bool = False,
                     check_word: str = '') -> dict:
@@ -657,8 +781,7 @@ def get_slots_paths(extension: str = '.py',
     If you can test it with SPIKE 3 app on the Spike Prime hub,
     please, give me feedback (GizmoBricksChannel@gmail.com)
     """
-    with open('projects/.slots', 'r') as slots_file:
-        slots_dict = eval(slots_file.readline())
+    slots_dict = _load_slots_dict()
 
     for key in slots_dict:
         slots_dict[key] = 'projects/{}/__init__{}'.format(
@@ -674,97 +797,192 @@ def get_slots_paths(extension: str = '.py',
     return slots_dict
 
 
-def get_line(file, remainder: list, width: int) -> tuple:
+class PBMStream:
     """
-    Reconstruct single line of the picture from PBM file.
-    File type should be P1 - ASCII (plain).
-    First 3 lines of the file should be read before the function call.
-
-    Reads from the given file object and constructs a line with
-    the specified width, considering any remaining characters from
-    the previous call.
-
-    Parameters:
-    - file (file): The file object to read from.
-    - remainder (list): A list containing characters left from
-                        the previous call.
-    - width (int): The desired width of the line.
-
-    Returns:
-    tuple: A tuple containing three elements:
-        1. List of characters representing the constructed line.
-        2. List of characters remaining after constructing the line.
-        3. Boolean indicating if the end of the file is reached.
+    Buffered reader for the raster of a PBM file.
+    File type should be P1 - ASCII (plain), opened in binary
+    mode ('rb'). The header (magic number, comments and dimensions)
+    should be read before the first read_row call.
+
+    The file is consumed in fixed-size chunks; whitespace is stripped
+    once per chunk with the C-implemented replace, and rows are
+    sliced straight off the accumulated buffer. Compared to the old
+    line-by-line reader this removes the readline/rstrip/replace
+    allocations for every line of the file.
+
+    Rows are returned as bytes: one byte per pixel instead of
+    a one-character string object per pixel, which matters a lot
+    on the memory-constrained hub.
     """
-    line = remainder[:]
-    reached_end = False
 
-    while len(line) < width:
-        content = file.readline().rstrip().replace(' ', '')
+    CHUNK_SIZE = 512
 
-        if content:
-            for char_ in content:
-                line.append(char_)
-        else:
-            reached_end = True
-            break
+    def __init__(self, file, width: int):
+        self._file = file
+        self._width = width
+        self._buffer = b''
 
-    remainder = line[width:]
-    line = line[:width]
-    return line, remainder, reached_end
-
-
-def get_range_args(line: list,
-                   axis_position: int,
-                   axis_step_: int = 1,
-                   to_nearest: bool = True,
-                   dot_value='1') -> tuple:
+    def read_row(self):
+        """
+        Return the next row of pixels as bytes,
+        or None when the file is exhausted.
+        """
+        while len(self._buffer) < self._width:
+            chunk = self._file.read(self.CHUNK_SIZE)
+            if not chunk:
+                return None
+            for junk in (b' ', b'\t', b'\r', b'\n'):
+                if junk in chunk:
+                    chunk = chunk.replace(junk, b'')
+            self._buffer += chunk
+
+        row = self._buffer[:self._width]
+        self._buffer = self._buffer[self._width:]
+        return row
+
+
+def plan_directions(extents: list,
+                    start_position: int,
+                    axis_step_: int = 1) -> list:
     """
-    Determine how the line should be iterated - from firs dot_value
-    to the last, or from the last dot_value to the first.
+    Choose a traversal direction for every row of the picture.
 
-    Returns arguments for the 'range()' function - start, stop,
-    and step.
+    A forward dynamic-programming pass: for each inked row keep the
+    cheapest total X travel that finishes at its left or at its right
+    extent, then backtrack the choices. The row order itself is fixed
+    (the paper feeds one way), so the per-row entry side is the whole
+    degree of freedom - this gives the optimal plan where the per-row
+    nearest-end greedy did not. O(rows) time and memory.
 
     Args:
-    - line (list): A list containing elements to search
-                   for the dot value.
-    - axis_position (int): The current position on the axis.
+    - extents (list): Per-row (first_index, last_index) pairs;
+                      first_index is -1 for rows without ink.
+    - start_position (int): X-axis position in degrees before
+                            the first row.
     - axis_step_ (int): Step by axis in degrees. (default: 1)
-    - to_nearest (bool, optional): Flag to determine iteration direction
-                                   (from nearest to farthest
-                                   or allways from first to last).
-                                   (default: True)
-    - dot_value (optional): The value to search for within the line.
-                            (default: '1')
 
     Returns:
-    - Tuple[int, int, int]: A tuple representing
-      the arguments for 'range()':
-      - If dot_value is not found in the list, returns (0, 0, 1).
-      - If iterating from nearest to farthest and dot_value found,
-        returns (first_index, last_index + 1, 1) or
-        (last_index, first_index - 1, -1), depends which index position
-        is closer to axis_position.
-      - If to_nearest is False and dot_value found,
-        returns (first_index, last_index + 1, 1).
+    - list: One direction per row - 1 (left to right) or -1
+            (right to left). Blank rows get 1.
     """
+    directions = [1] * len(extents)
+
+    inked = [index for index, extent in enumerate(extents)
+             if extent[0] >= 0]
+    if not inked:
+        return directions
+
+    # After a left-to-right row the pen rests at the right extent,
+    # after a right-to-left row - at the left one. cost_fwd/cost_rev
+    # hold the cheapest travel ending in each of those two states;
+    # from_fwd/from_rev remember the choice made at the previous
+    # inked row on each cheapest path.
+    first, last = extents[inked[0]]
+    cost_fwd = abs(start_position - first * axis_step_)
+    cost_rev = abs(start_position - last * axis_step_)
+    from_fwd = [0]
+    from_rev = [0]
+
+    previous_first, previous_last = first, last
+
+    for index in inked[1:]:
+        first, last = extents[index]
+        enter_fwd = first * axis_step_
+        enter_rev = last * axis_step_
+        exit_fwd = previous_last * axis_step_
+        exit_rev = previous_first * axis_step_
+
+        via_fwd = cost_fwd + abs(exit_fwd - enter_fwd)
+        via_rev = cost_rev + abs(exit_rev - enter_fwd)
+        if via_fwd <= via_rev:
+            new_cost_fwd, choice_fwd = via_fwd, 1
+        else:
+            new_cost_fwd, choice_fwd = via_rev, -1
 
-    indices = [index for index, value in enumerate(line) if value == dot_value]
-    if not indices:
-        return 0, 0, 1
-    first_index = indices[0]
-    last_index = indices[-1]
+        via_fwd = cost_fwd + abs(exit_fwd - enter_rev)
+        via_rev = cost_rev + abs(exit_rev - enter_rev)
+        if via_fwd <= via_rev:
+            new_cost_rev, choice_rev = via_fwd, 1
+        else:
+            new_cost_rev, choice_rev = via_rev, -1
+
+        cost_fwd, cost_rev = new_cost_fwd, new_cost_rev
+        from_fwd.append(choice_fwd)
+        from_rev.append(choice_rev)
+        previous_first, previous_last = first, last
+
+    choice = 1 if cost_fwd <= cost_rev else -1
+    for position in range(len(inked) - 1, -1, -1):
+        directions[inked[position]] = choice
+        choice = from_fwd[position] if choice == 1 else from_rev[position]
 
-    if to_nearest:
+    return directions
+
+
+def ink_runs(line: bytes, start: int, stop: int, direction: int = 1):
+    """
+    Yield contiguous runs of inked pixels from the line.
 
-        distance_to_first = abs(axis_position - first_index * axis_step_)
-        distance_to_last = abs(axis_position - last_index * axis_step_)
+    Traversal goes from start towards stop (exclusive, like range)
+    in the given direction. Each run is yielded as a pair of
+    inclusive indices (enter, exit) in traversal order, so
+    'range(enter, exit + direction, direction)' walks its pixels.
 
-        if distance_to_first > distance_to_last:
-            return last_index, first_index - 1, -1
+    The scanning is done with the C-implemented find/rfind, so blank
+    gaps between runs cost almost nothing at the Python level.
 
-    return first_index, last_index + 1, 1
+    Args:
+    - line (bytes): The pixel row to scan.
+    - start (int): Index where the traversal begins.
+    - stop (int): Index where the traversal ends (exclusive).
+    - direction (int): 1 for left to right, -1 for right to left.
+    """
+    if direction == 1:
+        position = start
+        while True:
+            enter = line.find(b'1', position, stop)
+            if enter < 0:
+                return
+            exit_ = line.find(b'0', enter, stop)
+            if exit_ < 0:
+                exit_ = stop
+            yield enter, exit_ - 1
+            position = exit_
+    else:
+        position = start
+        while position > stop:
+            enter = line.rfind(b'1', stop + 1, position + 1)
+            if enter < 0:
+                return
+            zero = line.rfind(b'0', stop + 1, enter)
+            exit_ = zero + 1 if zero >= 0 else stop + 1
+            yield enter, exit_
+            position = exit_ - 1
+
+
+# Field presence bits for the time modes below.
+_TIME_D = 8
+_TIME_HH = 4
+_TIME_MM = 2
+_TIME_SS = 1
+
+# Ready-made format string and field bits for every supported mode.
+# A single str.format call per conversion replaces the old chain of
+# four str.replace passes, and the bits replace the substring scans
+# that decided which divmods to run. The fields are zero-padded via
+# the _PAD2 table below, so the placeholders stay plain.
+_TIME_MODES = {
+    'mm:ss': ('{m}:{s}', _TIME_MM | _TIME_SS),
+    'hh:mm:ss': ('{h}:{m}:{s}', _TIME_HH | _TIME_MM | _TIME_SS),
+    'D.hh:mm:ss': ('{d}.{h}:{m}:{s}',
+                   _TIME_D | _TIME_HH | _TIME_MM | _TIME_SS),
+    'hh:mm': ('{h}:{m}', _TIME_HH | _TIME_MM),
+    'D.hh:mm': ('{d}.{h}:{m}', _TIME_D | _TIME_HH | _TIME_MM),
+}
+
+# Two-digit zero-padded strings for 0-99. Indexing this table is
+# cheaper than running the {:02} mini-language parser per field.
+_PAD2 = tuple('{:02}'.format(n) for n in range(100))
 
 
 def seconds_to_time(seconds: int, mode: str = 'hh:mm:ss') -> str:
@@ -784,33 +1002,38 @@ def seconds_to_time(seconds: int, mode: str = 'hh:mm:ss') -> str:
     - ValueError: If the provided mode is not one of the allowed modes.
     """
 
-    valid_modes = ('mm:ss', 'hh:mm:ss', 'D.hh:mm:ss', 'hh:mm', 'D.hh:mm')
-    if mode not in valid_modes:
+    try:
+        time_format, fields = _TIME_MODES[mode]
+    except KeyError:
         raise ValueError(
-            "Invalid mode. Allowed modes are: {}".format(valid_modes)
+            "Invalid mode. Allowed modes are: {}".format(
+                tuple(_TIME_MODES))
         )
 
     days = hours = minutes = 0
+    no_ss = 1 - (fields & _TIME_SS)
 
-    if 'D' in mode:
+    if fields & _TIME_D:
         days, seconds = divmod(seconds, 86400)  # 86400 sec in a day
 
-    if 'hh' in mode:
+    if fields & _TIME_HH:
         hours, seconds = divmod(seconds, 3600)  # 3600 sec in an hour
 
-    # It is allways True. It is here in case valid_modes changes.
-    if 'mm' in mode:
+    # It is allways True. It is here in case _TIME_MODES changes.
+    if fields & _TIME_MM:
         minutes, seconds = divmod(seconds, 60)
 
-    if seconds >= 30 and 'ss' not in mode:
-        minutes += 1
-
-    time_format = mode.replace('D', str(days))
-    time_format = time_format.replace('hh', "{:02}".format(hours))
-    time_format = time_format.replace('mm', "{:02}".format(minutes))
-    time_format = time_format.replace('ss', "{:02}".format(seconds))
+    # Branchless rounding: adds one minute only when the seconds are
+    # dropped from the output and would round up.
+    minutes += no_ss & (seconds >= 30)
 
-    return time_format
+    # Without the higher fields hours (and, in 'mm:ss' mode, minutes)
+    # can exceed the padding table.
+    return time_format.format(
+        d=days,
+        h=_PAD2[hours] if hours < 100 else hours,
+        m=_PAD2[minutes] if minutes < 100 else minutes,
+        s=_PAD2[seconds])
 
 
 def show_info(common_info: str = '',
@@ -831,12 +1054,20 @@ def show_info(common_info: str = '',
     Returns:
     - None
     """
-    print(preceding_info + common_info + following_info)
+    # Let print do the joining: no intermediate concatenated string.
+    print(preceding_info, common_info, following_info, sep='')
     hub.display.show(common_info + ' ',
                      delay=500, wait=False,
                      loop=True, fade=4)
 
 
+# Color names accepted by error_warning, mapped to hub.led codes.
+# Module scope, so the dict is built once instead of on every call.
+_LED_COLORS = {None: 0, 'off': 0, 'pink': 1, 'violet': 2, 'blue': 3,
+               'turquoise': 4, 'light green': 5, 'green': 6,
+               'yellow': 7, 'orange': 8, 'red': 9, 'white': 10}
+
+
 def error_warning(error_description, error_name: str, color=None) -> None:
     """
     Display error information based on the error type provided.
@@ -846,11 +1077,8 @@ def error_warning(error_description, error_name: str, color=None) -> None:
     Returns:
     - None
     """
-    color_dictionary = {None: 0, 'off': 0, 'pink': 1, 'violet': 2, 'blue': 3,
-                        'turquoise': 4, 'light green': 5, 'green': 6,
-                        'yellow': 7, 'orange': 8, 'red': 9, 'white': 10}
-    if color in color_dictionary:
-        hub.led(color_dictionary[color])
+    if color in _LED_COLORS:
+        hub.led(_LED_COLORS[color])
     elif isinstance(color, int):
         hub.led(color)
     elif isinstance(color, tuple):
@@ -863,38 +1091,50 @@ def error_warning(error_description, error_name: str, color=None) -> None:
         wait_for_seconds(0.3)
 
 
+# Animations are built once at import time: every hub.Image call
+# allocates on the heap, and the functions below may run many times
+# per print job.
+_TAP_ANIMATION = (hub.Image('00000:00000:00900:00000:00000:'),
+                  hub.Image('00000:09990:09990:09990:00000:'),
+                  hub.Image('00000:09990:09090:09990:00000:'),
+                  hub.Image('00000:09990:09990:09990:00000:'),
+                  hub.Image('00000:00000:00900:00000:00000:'),
+                  hub.Image('00000:00000:00000:00000:00000:'))
+
+
 def wait_until_tapped():
     """
     Display an animation until a tap gesture is detected.
     """
-    animation = (hub.Image('00000:00000:00900:00000:00000:'),
-                 hub.Image('00000:09990:09990:09990:00000:'),
-                 hub.Image('00000:09990:09090:09990:00000:'),
-                 hub.Image('00000:09990:09990:09990:00000:'),
-                 hub.Image('00000:00000:00900:00000:00000:'),
-                 hub.Image('00000:00000:00000:00000:00000:'))
-    hub.display.show(animation, delay=600, wait=False, loop=True, fade=2)
+    hub.display.show(_TAP_ANIMATION, delay=600, wait=False, loop=True,
+                     fade=2)
     hub.sound.beep(131, 500, 0)
     print('Tap the hub to continue.')
+    # Sleep between polls instead of spinning: the runtime gets time
+    # to render the animation and the battery is not drained by a
+    # tight interpreter loop.
     while hub.motion.gesture() != 0:
-        continue
+        wait_for_seconds(0.05)
     hub.display.clear()
 
 
+_CALIBRATION_ANIMATION = (hub.Image('00000:00000:90000:00000:00000:'),
+                          hub.Image('00000:00000:99000:00000:00000:'),
+                          hub.Image('00000:00000:99900:00000:00000:'),
+                          hub.Image('00000:00000:99990:00000:00000:'),
+                          hub.Image('00000:00000:99999:00000:00000:'),
+                          hub.Image('00000:00000:09999:00000:00000:'),
+                          hub.Image('00000:00000:00999:00000:00000:'),
+                          hub.Image('00000:00000:00099:00000:00000:'),
+                          hub.Image('00000:00000:00009:00000:00000:'),
+                          hub.Image('00000:00000:00000:00000:00000:'))
+
+
 def calibration():
-    animation = (hub.Image('00000:00000:90000:00000:00000:'),
-                 hub.Image('00000:00000:99000:00000:00000:'),
-                 hub.Image('00000:00000:99900:00000:00000:'),
-                 hub.Image('00000:00000:99990:00000:00000:'),
-                 hub.Image('00000:00000:99999:00000:00000:'),
-                 hub.Image('00000:00000:09999:00000:00000:'),
-                 hub.Image('00000:00000:00999:00000:00000:'),
-                 hub.Image('00000:00000:00099:00000:00000:'),
-                 hub.Image('00000:00000:00009:00000:00000:'),
-                 hub.Image('00000:00000:00000:00000:00000:'))
     print('Calibration...\n'
           'Please wait, it may take a while.')
-    hub.display.show(animation, delay=200, wait=False, loop=True, fade=2)
+    hub.display.show(_CALIBRATION_ANIMATION, delay=200, wait=False,
+                     loop=True, fade=2)
 
     pen.put_up()
 
@@ -904,24 +1144,25 @@ def calibration():
     x_axis.calibrate_end()
     x_axis.go_home()
 
+    # Collect the report lines and join them once: each line is
+    # formatted on its own and no big template string is rebuilt.
+    report = [' \nCalibration done.',
+              'Dot diameter is {} mm'.format(DOT_DIMENSION),
+              'X-axis step is {} degrees per dot'.format(x_axis.step),
+              'Y-axis step is {} degrees per dot'.format(y_axis.step)]
+
     if BACKLASH_CORRECTION:
-        backlash_info = ('Backlash correction is applied. '
-                         'Correction value is {} degrees.'.format(
-                          x_axis.correction_step))
+        report.append('Backlash correction is applied. '
+                      'Correction value is {} degrees.'.format(
+                       x_axis.correction_step))
     else:
-        backlash_info = 'Backlash correction is not applied.'
-
-    print(' \nCalibration done.\n'
-          'Dot diameter is {} mm\n'
-          'X-axis step is {} degrees per dot\n'
-          'Y-axis step is {} degrees per dot\n'
-          '{}\n'
-          'The width of the printing area is '
-          '{} mm or {} dots'.format(DOT_DIMENSION,
-                                    x_axis.step, y_axis.step,
-                                    backlash_info,
-                                    x_axis.length * DOT_DIMENSION,
-                                    x_axis.length))
+        report.append('Backlash correction is not applied.')
+
+    report.append('The width of the printing area is '
+                  '{} mm or {} dots'.format(x_axis.length * DOT_DIMENSION,
+                                            x_axis.length))
+
+    print('\n'.join(report))
 
     x_axis.wait_until_motion_done()
 
@@ -931,116 +1172,201 @@ def calibration():
     hub.display.clear()
 
 
+class InvalidPBMError(RuntimeError):
+    """Raised when a file is not a valid plain PBM file."""
+
+
+class WidthError(RuntimeError):
+    """Raised when a picture is wider than the printing area."""
+
+
 def picture_dimensions(file) -> tuple:
     """
     Extracts the width and height dimensions
     from a PBM (Portable BitMap) file.
 
     Arguments:
-    file (file): The PBM file object opened in read mode ('r').
+    file (file): The PBM file object opened in binary read mode ('rb').
 
     Returns:
     tuple: A tuple containing the width and height
            extracted from the file.
 
     Raises:
-    RuntimeError: If there is an issue with the file format
-                  or missing dimensions after comments.
-    ValueError: If the extracted dimensions are invalid
-                (negative or zero values).
+    InvalidPBMError: If there is an issue with the file format,
+                     missing dimensions after comments,
+                     or negative or zero dimension values.
 
     Note: Always use 'with' when open file.
     """
-    line = '#'
-
-    while line.startswith('#'):
+    # line[:1] compares a single byte and stays b'' at end of file,
+    # so the loop needs no startswith call and no seed value.
+    line = file.readline()
+    while line[:1] == b'#':
         line = file.readline()
 
     try:
-        width, height = map(int, line.split())
+        width, height = map(int, line.decode().split())
     except ValueError:
-        raise RuntimeError(
+        raise InvalidPBMError(
             'Expected picture dimensions after comments in PBM-file.\n')
 
     if width < 1 or height < 1:
-        raise ValueError(
+        raise InvalidPBMError(
             'Picture dimensions cannot be negative or 0.\n'
-            'The problem line values: {}'.format(line))
+            'The problem line values: {}'.format(line.decode()))
 
     return width, height
 
 
-def printing(image_path):
-    animation = (hub.Image('90000:00000:00000:00000:00000:'),
-                 hub.Image('99000:00000:00000:00000:00000:'),
-                 hub.Image('99900:00000:00000:00000:00000:'),
-                 hub.Image('99990:00000:00000:00000:00000:'),
-                 hub.Image('99999:00000:00000:00000:00000:'),
-                 hub.Image('99999:00009:00000:00000:00000:'),
-                 hub.Image('99999:00099:00000:00000:00000:'),
-                 hub.Image('99999:00999:00000:00000:00000:'),
-                 hub.Image('99999:09999:00000:00000:00000:'),
-                 hub.Image('99999:99999:00000:00000:00000:'),
-                 hub.Image('99999:99999:90000:00000:00000:'),
-                 hub.Image('99999:99999:99000:00000:00000:'),
-                 hub.Image('99999:99999:99900:00000:00000:'),
-                 hub.Image('99999:99999:99990:00000:00000:'),
-                 hub.Image('99999:99999:99999:00000:00000:'),
-                 hub.Image('99999:99999:99999:00009:00000:'),
-                 hub.Image('99999:99999:99999:00099:00000:'),
-                 hub.Image('99999:99999:99999:00999:00000:'),
-                 hub.Image('99999:99999:99999:09999:00000:'),
-                 hub.Image('99999:99999:99999:99999:00000:'),
-                 hub.Image('99999:99999:99999:99999:90000:'),
-                 hub.Image('99999:99999:99999:99999:99000:'),
-                 hub.Image('99999:99999:99999:99999:99900:'),
-                 hub.Image('99999:99999:99999:99999:99990:'),
-                 hub.Image('99999:99999:99999:99999:99999:'),
-                 hub.Image('99999:99999:99999:99999:00000:'),
-                 hub.Image('99999:99999:99999:00000:00000:'),
-                 hub.Image('99999:99999:00000:00000:00000:'),
-                 hub.Image('99999:00000:00000:00000:00000:'),
-                 hub.Image('00000:00000:00000:00000:00000:'))
-
-    hub.display.show(animation, delay=1000, wait=False, loop=True, fade=2)
-    with open(image_path, 'r') as picture:
-        next(picture)
-        picture_width, _ = picture_dimensions(picture)
-
-        if picture_width > x_axis.length:
-            raise RuntimeError(
-                'Picture is too width.\n'
-                'You are trying to print a picture that is '
-                '{pic_width} pixels wide,\n'
-                'but the printer can only print images '
-                'that are {print_width} pixels wide.\n'
-                'Resize current picture, '
-                'try to decrease the DOT_DIMENSION constant,\n'
-                'or try another picture.'.format(
-                    pic_width=picture_width,
-                    print_width=x_axis.length)
-            )
+def parse_pbm(file, max_width: int) -> tuple:
+    """
+    Read a whole plain PBM file: header and raster.
 
-        print(' \nPrinting...')
+    Arguments:
+    file (file): The PBM file object opened in binary read
+                 mode ('rb'), positioned at the start.
+    max_width (int): The widest printable picture, in dots.
 
-        rest_of_line = []
-        while True:
-            line, rest_of_line, end_of_picture = get_line(picture,
-                                                          rest_of_line,
-                                                          picture_width)
-            if end_of_picture:
-                break
-            line_start, line_end, direction = get_range_args(
-                line, x_axis.get_position(), x_axis.step, SHORTEST_PATH)
+    Returns:
+    tuple: (width, rows, extents) where rows is a list of bytes
+           objects (one byte per pixel) and extents holds the
+           (first_index, last_index) pair of inked pixels per row,
+           with first_index == -1 for blank rows.
 
-            y_axis.wait_until_motion_done()
+    Raises:
+    WidthError: If the picture is wider than max_width. Raised
+                right after the header, before the raster is read:
+                a too-wide raster is the one most likely to exhaust
+                the hub's memory, so it must not be loaded just to
+                be rejected.
+    """
+    next(file)  # Skip the magic number line.
+    width, _ = picture_dimensions(file)
+
+    if width > max_width:
+        raise WidthError(
+            'Picture is too width.\n'
+            'You are trying to print a picture that is '
+            '{pic_width} pixels wide,\n'
+            'but the printer can only print images '
+            'that are {print_width} pixels wide.\n'
+            'Resize current picture, '
+            'try to decrease the DOT_DIMENSION constant,\n'
+            'or try another picture.'.format(
+                pic_width=width,
+                print_width=max_width)
+        )
+
+    # One byte per pixel keeps even large pictures small, and bytes
+    # rows let the printing loop scan ink runs with find/rfind.
+    raster = PBMStream(file, width)
+    rows = []
+    extents = []
+    while True:
+        line = raster.read_row()
+        if line is None:
+            break
+        rows.append(line)
+        extents.append((line.find(b'1'), line.rfind(b'1')))
+
+    return width, rows, extents
+
+
+_PRINTING_ANIMATION = (hub.Image('90000:00000:00000:00000:00000:'),
+                       hub.Image('99000:00000:00000:00000:00000:'),
+                       hub.Image('99900:00000:00000:00000:00000:'),
+                       hub.Image('99990:00000:00000:00000:00000:'),
+                       hub.Image('99999:00000:00000:00000:00000:'),
+                       hub.Image('99999:00009:00000:00000:00000:'),
+                       hub.Image('99999:00099:00000:00000:00000:'),
+                       hub.Image('99999:00999:00000:00000:00000:'),
+                       hub.Image('99999:09999:00000:00000:00000:'),
+                       hub.Image('99999:99999:00000:00000:00000:'),
+                       hub.Image('99999:99999:90000:00000:00000:'),
+                       hub.Image('99999:99999:99000:00000:00000:'),
+                       hub.Image('99999:99999:99900:00000:00000:'),
+                       hub.Image('99999:99999:99990:00000:00000:'),
+                       hub.Image('99999:99999:99999:00000:00000:'),
+                       hub.Image('99999:99999:99999:00009:00000:'),
+                       hub.Image('99999:99999:99999:00099:00000:'),
+                       hub.Image('99999:99999:99999:00999:00000:'),
+                       hub.Image('99999:99999:99999:09999:00000:'),
+                       hub.Image('99999:99999:99999:99999:00000:'),
+                       hub.Image('99999:99999:99999:99999:90000:'),
+                       hub.Image('99999:99999:99999:99999:99000:'),
+                       hub.Image('99999:99999:99999:99999:99900:'),
+                       hub.Image('99999:99999:99999:99999:99990:'),
+                       hub.Image('99999:99999:99999:99999:99999:'),
+                       hub.Image('99999:99999:99999:99999:00000:'),
+                       hub.Image('99999:99999:99999:00000:00000:'),
+                       hub.Image('99999:99999:00000:00000:00000:'),
+                       hub.Image('99999:00000:00000:00000:00000:'),
+                       hub.Image('00000:00000:00000:00000:00000:'))
 
-            for j in range(line_start, line_end, direction):
-                if line[j] == '1':
-                    x_axis.run_to_position(j, True, 'steps')
-                    pen.put_dot()
 
-            y_axis.move_steps(1)
+def printing(image_path):
+    hub.display.show(_PRINTING_ANIMATION, delay=1000, wait=False,
+                     loop=True, fade=2)
+    # Binary mode: the raster reader works on bytes, and skipping the
+    # text-mode decoding avoids a per-chunk copy of the whole file.
+    with open(image_path, 'rb') as picture:
+        picture_width, rows, extents = parse_pbm(picture, x_axis.length)
+
+        print(' \nPrinting...')
+
+        if SHORTEST_PATH:
+            directions = plan_directions(extents, x_axis.get_position(),
+                                         x_axis.step)
+        else:
+            # Constant plan, resolved before the loop so the per-row
+            # code has no SHORTEST_PATH conditional left.
+            directions = [1] * len(rows)
+
+        # Bind the hot methods to locals: dotted attribute lookups
+        # are slow on MicroPython and these run for every dot.
+        x_run = x_axis.run_to_position
+        y_move = y_axis.move_steps
+        y_wait = y_axis.wait_until_motion_done
+        pen_dot = pen.put_dot
+        pen_down = pen.put_down
+        pen_up = pen.put_up
+
+        for k, line in enumerate(rows):
+            first, last = extents[k]
+
+            y_wait()
+
+            if first < 0:
+                # Blank row - just feed the paper.
+                y_move(1)
+                continue
+
+            direction = directions[k]
+            if direction == 1:
+                line_start, line_end = first, last + 1
+            else:
+                line_start, line_end = last, first - 1
+
+            for run_start, run_end in ink_runs(line, line_start,
+                                               line_end, direction):
+                x_run(run_start, True, 'steps')
+                if run_start == run_end:
+                    pen_dot()
+                else:
+                    # Contiguous ink: keep the pen down through the
+                    # whole run and lift it only once at the end,
+                    # instead of a full up-down cycle per pixel.
+                    # No backlash correction inside the run - the
+                    # overshoot would draw past the run's end, and a
+                    # continuous line hides the lash anyway.
+                    pen_down()
+                    for j in range(run_start + direction,
+                                   run_end + direction, direction):
+                        x_run(j, True, 'steps', False)
+                    pen_up()
+
+            y_move(1)
 
     hub.display.clear()
     x_axis.go_home()
@@ -1071,16 +1397,12 @@ if paths:
 
     try:
         printing(slot_path)
+    except WidthError as error:
+        error_warning(error, 'WIDTH ERROR', 'yellow')
+    except InvalidPBMError as error:
+        error_warning(error, 'INVALID FILE', 'orange')
     except (RuntimeError, ValueError) as error:
-        if str(error).startswith('Picture is too width'):
-            error_warning(error, 'WIDTH ERROR', 'yellow')
-        elif (str(error).startswith(
-                'Picture dimensions cannot be negative or 0')
-              or str(error).startswith(
-                    'Expected picture dimensions after comments')):
-            error_warning(error, 'INVALID FILE', 'orange')
-        else:
-            error_warning(error, 'ANOTHER ERROR', (255, 0, 255))
+        error_warning(error, 'ANOTHER ERROR', (255, 0, 255))
     else:
         hub.led(6)  # green
         show_info(seconds_to_time(printing_timer.now()),